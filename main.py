@@ -9,23 +9,40 @@ after each run to persist state across ephemeral runners.
 import json
 import logging
 import os
+import re
 import time
-from datetime import datetime, timezone
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import fcntl  # POSIX only; without it (Windows) runs simply aren't locked
+except ImportError:
+    fcntl = None
+
+try:
+    import orjson  # Optional: much faster JSON; the stdlib fallback behaves the same
+except ImportError:
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Config
 # ---------------------------------------------------------------------------
 
+# KEY=value lines; comments and blank lines never match. [ \t] rather than \s
+# so an empty value cannot swallow the newline and the next line with it.
+ENV_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
+
 # Load .env file for local development if it exists
 if os.path.exists(".env"):
     with open(".env", "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, val = line.split("=", 1)
-                os.environ.setdefault(key.strip(), val.strip())
+        env_text = f.read()
+    for match in ENV_LINE_RE.finditer(env_text):
+        os.environ.setdefault(match.group(1), match.group(2))
 
 # To add more boards, just append to this list:
 BOARDS = [
@@ -35,12 +52,73 @@ BOARDS = [
     },
 ]
 
-JOBS_FILE = "jobs.json"
+JOBS_FILE = "jobs.json"             # Base snapshot; per-run changes go to jobs.delta.jsonl
+DELTA_COMPACT_LINES = 50            # Fold the journal back into jobs.json after this many runs
+BOARD_CACHE_FILE = "boards.json"    # Per-board ETag / Last-Modified and last fetched jobs
+FAILURE_BACKOFF_MAX_RUNS = 4        # Most runs a failing board sits out (2h at the */30 cron)
+LOCK_FILE = "bot.lock"              # Guards overlapping runs on one machine (see acquire_run_lock)
+ACTIVITY_FILE = "activity.json"     # When new jobs last appeared, for adaptive polling
+ACTIVITY_EMA_WEIGHT = 0.3           # Weight of the newest gap in the rolling mean
+QUIET_GAP_SECONDS = 24 * 60 * 60    # Mean gap above which scheduled runs are halved
+TELEGRAM_MAX_ATTEMPTS = 3           # Sends per message when Telegram answers 429
+TELEGRAM_MESSAGE_LIMIT = 4000       # Max chars per batched alert (Telegram caps at 4096)
 LOG_FILE = "bot.log"
 
 TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID", "")
 
+# One session for every request (Ashby and Telegram) so calls to the same host
+# reuse a pooled keep-alive connection instead of repeating the TCP/TLS handshake.
+# The adapter also owns retries: transient failures and 429/5xx are retried with
+# exponential backoff (0.5s, 1s). POST is included so Telegram sends keep the
+# retry they always had.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+        ),
+    ),
+)
+# Telegram gets its own adapter without 429 in the forcelist: its 429 body carries
+# the exact retry_after, which send_telegram_message() honours instead.
+SESSION.mount(
+    "https://api.telegram.org/",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["POST"],
+        ),
+    ),
+)
+
+# ---------------------------------------------------------------------------
+# JSON helpers
+# ---------------------------------------------------------------------------
+
+def json_loads(data: bytes) -> object:
+    """Parse JSON bytes. orjson.JSONDecodeError subclasses json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: object) -> bytes:
+    """Serialise to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 # ---------------------------------------------------------------------------
 # Logging setup
 # ---------------------------------------------------------------------------
@@ -58,56 +136,144 @@ logging.basicConfig(
 # Ashby API
 # ---------------------------------------------------------------------------
 
-def fetch_jobs(board: dict) -> list[dict]:
+# fetch_jobs() result for a 304. Distinct from [] (failure) so main can tell
+# "nothing changed" apart from "nothing fetched".
+NOT_MODIFIED = None
+
+
+def fetch_jobs(board: dict, cache: dict) -> Optional[list[tuple[str, dict, str]]]:
     """
     Fetch all current jobs from a specific Ashby public API board.
-    Returns a normalised list of job dicts, or [] on any failure.
+    Returns (internal_id, raw_job, platform_name) tuples, [] on any failure,
+    or NOT_MODIFIED when the board answers 304.
+    Jobs are not normalised here: the caller only needs IDs to diff, and
+    normalises just the new ones.
+
+    `cache` is this board's entry from BOARD_CACHE_FILE. Its ETag / Last-Modified
+    are sent as validators; on 304 nothing is downloaded or parsed and the caller
+    reuses cache["raw_jobs"]. On 200 the entry is updated in place.
+    After a 5xx, 429 or network failure the board sits out the next
+    cache["skip_runs"] runs, so our retries don't add to an Ashby outage.
     """
     url = board["url"]
     name = board["name"]
+
+    skip_runs = cache.get("skip_runs", 0)
+    if skip_runs > 0:
+        cache["skip_runs"] = skip_runs - 1
+        logging.warning(
+            f"Skipping {name}: backing off for {skip_runs} run(s) after "
+            f"{cache.get('consecutive_failures', 0)} consecutive failure(s)."
+        )
+        return []
+
+    headers = {}
+    if cache.get("raw_jobs") is not None:
+        # Only ask for a 304 when we still hold the list it would point us back to
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
     try:
-        response = requests.get(url, timeout=15)
+        response = SESSION.get(url, headers=headers, timeout=15)
+        if response.status_code == 304:
+            logging.info(f"{name} unchanged since last run (304).")
+            clear_board_failures(cache)
+            return NOT_MODIFIED
         response.raise_for_status()
-        data = response.json()
-        raw_jobs = data.get("jobs", [])
-        return [normalise_job(job, name) for job in raw_jobs if isinstance(job, dict)]
+        # Parse the raw bytes directly rather than going through response.json()
+        data = json_loads(response.content)
+        # Keep only the fields normalise_job() reads; Ashby also sends full
+        # descriptions, which would bloat the committed cache file
+        raw_jobs = [
+            {key: job[key] for key in ASHBY_JOB_FIELDS if key in job}
+            for job in data.get("jobs", [])
+            if isinstance(job, dict)
+        ]
+        cache["etag"] = response.headers.get("ETag")
+        cache["last_modified"] = response.headers.get("Last-Modified")
+        cache["raw_jobs"] = raw_jobs
+        cache.pop("jobs", None)  # Normalised list cached by older versions
+        clear_board_failures(cache)
+        return tag_jobs(raw_jobs, name)
     except requests.exceptions.Timeout:
         logging.error(f"Ashby API timed out for {name}.")
+        record_board_failure(cache)
         return []
     except requests.exceptions.HTTPError as e:
-        logging.error(f"Ashby API HTTP error for {name}: {e.response.status_code}")
+        status = e.response.status_code
+        logging.error(f"Ashby API HTTP error for {name}: {status}")
+        # Only server-side trouble is worth backing off from; a 4xx won't fix itself by waiting
+        if status >= 500 or status == 429:
+            record_board_failure(cache)
         return []
     except requests.exceptions.RequestException as e:
         logging.error(f"Network error fetching jobs for {name}: {e}")
+        record_board_failure(cache)
         return []
     except (ValueError, KeyError) as e:
         logging.error(f"Failed to parse Ashby response for {name}: {e}")
         return []
 
 
-def normalise_job(raw: dict, platform_name: str) -> dict:
-    employment_type_map = {
-        "FullTime": "Full-Time",
-        "PartTime": "Part-Time",
-        "Contract": "Contract",
-        "Intern": "Internship",
-    }
-    raw_type = raw.get("employmentType", "")
+def record_board_failure(cache: dict) -> None:
+    """
+    Back the board off exponentially: skip the next 1, 2, 4 ... runs, capped at
+    FAILURE_BACKOFF_MAX_RUNS. Counted in runs rather than seconds because the bot
+    only runs on the cron schedule; any wall-clock backoff shorter than the cron
+    interval would already have expired by the next run.
+    """
+    failures = cache.get("consecutive_failures", 0) + 1
+    cache["consecutive_failures"] = failures
+    cache["skip_runs"] = min(FAILURE_BACKOFF_MAX_RUNS, 2 ** (failures - 1))
+    cache.pop("fail_until", None)  # Wall-clock backoff written by older versions
+
+
+def clear_board_failures(cache: dict) -> None:
+    cache.pop("consecutive_failures", None)
+    cache.pop("skip_runs", None)
+    cache.pop("fail_until", None)
+
+
+# The Ashby job fields normalise_job() and compute_job_id() read
+ASHBY_JOB_FIELDS = (
+    "id", "title", "department", "team", "location", "isRemote",
+    "employmentType", "publishedAt", "jobUrl", "applyUrl",
+)
+
+# Ashby's PascalCase employmentType values → display text
+EMPLOYMENT_TYPE_MAP = {
+    "FullTime": "Full-Time",
+    "PartTime": "Part-Time",
+    "Contract": "Contract",
+    "Intern": "Internship",
+}
+
+
+def tag_jobs(raw_jobs: list[dict], platform_name: str) -> list[tuple[str, dict, str]]:
+    """Pair each raw job with its internal ID and board name, as main() expects."""
+    return [(compute_job_id(job, platform_name), job, platform_name) for job in raw_jobs]
+
+
+def compute_job_id(raw: dict, platform_name: str) -> str:
     # Fallback ID: deterministic string so we can still track the job if id is null
     job_id = raw.get("id") or f"{raw.get('title', '')}_{raw.get('publishedAt', '')}"
-    
+
     # We prefix ID with platform for global uniqueness across multiple boards
-    internal_id = f"{platform_name}:{job_id}"
-    
+    return f"{platform_name}:{job_id}"
+
+
+def normalise_job(raw: dict, platform_name: str) -> dict:
+    raw_type = raw.get("employmentType", "")
     return {
-        "id":              internal_id,
+        "id":              compute_job_id(raw, platform_name),
         "platform":        platform_name,
         "title":           raw.get("title", "Untitled Role"),
         "department":      raw.get("department", "Unknown"),
         "team":            raw.get("team", ""),
         "location":        raw.get("location", "Unknown"),
         "is_remote":       raw.get("isRemote", False),
-        "employment_type": employment_type_map.get(raw_type, raw_type),
+        "employment_type": EMPLOYMENT_TYPE_MAP.get(raw_type, raw_type),
         "published_at":    raw.get("publishedAt", ""),
         "job_url":         raw.get("jobUrl", ""),
         "apply_url":       raw.get("applyUrl", ""),
@@ -117,44 +283,248 @@ def normalise_job(raw: dict, platform_name: str) -> dict:
 # State persistence
 # ---------------------------------------------------------------------------
 
-def load_seen_ids(filepath: str) -> tuple[set, bool]:
+def write_json_atomic(data: dict, filepath: str) -> None:
     """
-    Returns (ids: set, is_first_run: bool).
+    Write JSON to a temp file, fsync it, then rename it over `filepath`.
+    Opening the real file with "w" truncates it first, so a runner killed mid-write
+    would leave it empty and the next run would re-announce every job.
+    os.replace() is atomic on the same filesystem: readers see the old file or the new one.
+    Raises IOError like open() does; callers decide how to log it.
+    """
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(json_dumps(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+
+
+def delta_path(filepath: str) -> str:
+    """Path of the append-only journal that sits next to the base snapshot."""
+    root, _ = os.path.splitext(filepath)
+    return f"{root}.delta.jsonl"
+
+
+def load_seen_ids(filepath: str) -> tuple[set, bool, bool]:
+    """
+    Returns (ids: set, is_first_run: bool, needs_snapshot: bool).
+    The seen set is the base snapshot with every journal line replayed on top.
     is_first_run=True when the file doesn't exist — caller suppresses notifications.
-    A corrupted file is treated as a non-first run with an empty set.
+    A corrupted file is treated as a non-first run with only the journal's IDs,
+    and needs_snapshot=True tells the caller to rewrite it with save_seen_ids():
+    journal lines appended to a broken base would never repair it.
     """
     if not os.path.exists(filepath):
-        return set(), True  # Genuine first run
+        return set(), True, False  # Genuine first run
 
+    needs_snapshot = False
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return set(data.get("ids", [])), False
+        with open(filepath, "rb") as f:
+            data = json_loads(f.read())
+        ids = set(data.get("ids", []))
     except (json.JSONDecodeError, IOError) as e:
-        logging.warning(f"Could not read {filepath}: {e}. Starting with empty seen-IDs.")
-        return set(), False
+        logging.warning(f"Could not read {filepath}: {e}. Rebuilding it from this run's jobs.")
+        # Still replay the journal below: IDs added since the last compaction
+        # are known, so at least those won't be announced again
+        ids = set()
+        needs_snapshot = True
+
+    journal = delta_path(filepath)
+    if not os.path.exists(journal):
+        return ids, False, needs_snapshot
+
+    try:
+        with open(journal, "rb") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    delta = json_loads(line)
+                except json.JSONDecodeError as e:
+                    # A torn final line (runner killed mid-append) must not wipe the whole state
+                    logging.warning(f"Skipping corrupt line {line_no} in {journal}: {e}")
+                    continue
+                ids.update(delta.get("added", []))
+                ids.difference_update(delta.get("removed", []))
+    except IOError as e:
+        logging.warning(f"Could not read {journal}: {e}. Using base snapshot only.")
+
+    return ids, False, needs_snapshot
 
 
 def save_seen_ids(ids: set, filepath: str) -> None:
     """
-    Write the current set of seen IDs to disk.
+    Write the full set of seen IDs to the base snapshot and clear the journal.
     Always call this BEFORE sending Telegram messages (write-before-notify pattern).
     If the script crashes mid-send, IDs are already persisted — no duplicates on restart.
     """
     try:
-        data = {"ids": sorted(list(ids))}
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        write_json_atomic({"ids": sorted(ids)}, filepath)
+        # The snapshot now contains everything the journal described.
+        # Replaying the journal on top of it is harmless, so a crash before this
+        # truncation only costs a little extra work on the next load.
+        with open(delta_path(filepath), "w", encoding="utf-8"):
+            pass
     except IOError as e:
         logging.error(f"Failed to save seen IDs to {filepath}: {e}")
 
+
+def append_seen_delta(ids: set, added: set, removed: set, filepath: str) -> None:
+    """
+    Record one run's changes as a single journal line instead of rewriting the snapshot.
+    A run with no changes writes nothing, so the workflow has nothing to commit.
+    Once the journal grows past DELTA_COMPACT_LINES, `ids` is folded into a fresh snapshot.
+    Same write-before-notify rule as save_seen_ids().
+    """
+    if not added and not removed:
+        return
+
+    journal = delta_path(filepath)
+    try:
+        line = json_dumps({"added": sorted(added), "removed": sorted(removed)})
+        with open(journal, "a+b") as f:
+            f.seek(0)
+            existing = f.read()
+            if existing and not existing.endswith(b"\n"):
+                # Seal a torn line left by a killed run so this entry stays parseable
+                f.write(b"\n")
+            f.write(line + b"\n")
+        line_count = existing.count(b"\n") + 1
+    except IOError as e:
+        logging.error(f"Failed to append seen-ID changes to {journal}: {e}")
+        return
+
+    if line_count >= DELTA_COMPACT_LINES:
+        logging.info(f"Compacting {journal} ({line_count} entries) into {filepath}.")
+        save_seen_ids(ids, filepath)
+
+
+def load_board_cache(filepath: str) -> dict:
+    """
+    Returns {board_name: entry} from the last run, where each entry holds
+    "etag" / "last_modified" (validators for the conditional GET), "raw_jobs"
+    (jobs trimmed to ASHBY_JOB_FIELDS) and, while the board is failing,
+    "consecutive_failures" / "skip_runs" (its backoff state).
+    A missing or corrupted file just means every board is fetched in full.
+    """
+    if not os.path.exists(filepath):
+        return {}
+
+    try:
+        with open(filepath, "rb") as f:
+            return json_loads(f.read())
+    except (json.JSONDecodeError, IOError) as e:
+        logging.warning(f"Could not read {filepath}: {e}. Fetching all boards in full.")
+        return {}
+
+
+def save_board_cache(cache: dict, filepath: str) -> None:
+    """Write the per-board validators and job lists for the next run's conditional GETs."""
+    try:
+        write_json_atomic(cache, filepath)
+    except IOError as e:
+        logging.error(f"Failed to save board cache to {filepath}: {e}")
+
+
+def record_new_postings(filepath: str) -> None:
+    """
+    Update the rolling mean gap between runs that found new jobs, and flag the
+    boards as quiet once that gap exceeds QUIET_GAP_SECONDS. The workflow reads
+    "quiet" before installing anything and skips every other scheduled run.
+    Only called when new jobs were found, so idle runs still write nothing.
+    """
+    activity = {}
+    if os.path.exists(filepath):
+        try:
+            with open(filepath, "rb") as f:
+                activity = json_loads(f.read())
+        except (json.JSONDecodeError, IOError) as e:
+            logging.warning(f"Could not read {filepath}: {e}. Resetting activity history.")
+
+    now = time.time()
+    last_change = activity.get("last_change_ts")
+    ema_gap = activity.get("ema_gap_seconds")
+    if last_change is not None:
+        gap = now - last_change
+        # The first measured gap seeds the average; later ones are blended in
+        if ema_gap is None:
+            ema_gap = gap
+        else:
+            ema_gap = (1 - ACTIVITY_EMA_WEIGHT) * ema_gap + ACTIVITY_EMA_WEIGHT * gap
+
+    quiet = ema_gap is not None and ema_gap > QUIET_GAP_SECONDS
+    if ema_gap is not None:
+        logging.info(
+            f"Mean gap between new postings: {ema_gap / 3600:.1f}h. "
+            f"{'Quiet: polling every other run.' if quiet else 'Polling on every run.'}"
+        )
+
+    try:
+        write_json_atomic(
+            {"last_change_ts": now, "ema_gap_seconds": ema_gap, "quiet": quiet},
+            filepath,
+        )
+    except IOError as e:
+        logging.error(f"Failed to save activity to {filepath}: {e}")
+
+
+def acquire_run_lock(filepath: str) -> Optional[object]:
+    """
+    Take an exclusive, non-blocking lock on `filepath` for the rest of the run.
+    Returns the open file (the caller must keep it alive), or None when another
+    run on this machine already holds the lock.
+    This only guards runs sharing a filesystem, e.g. local runs. Each GitHub
+    Actions run is a fresh VM, so there the workflow's concurrency group and
+    branch-head checkout keep runs from sending the same alerts twice.
+    """
+    handle = open(filepath, "w")
+    if fcntl is None:
+        return handle
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
 # ---------------------------------------------------------------------------
 # Telegram
 # ---------------------------------------------------------------------------
 
+class RateLimiter:
+    """
+    Token bucket: allows `rate` calls per `per` seconds, bursting up to `rate`.
+    acquire() blocks just long enough for the next token to become available.
+    """
+
+    def __init__(self, rate: float, per: float) -> None:
+        self.rate = rate
+        self.per = per
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+
+    def acquire(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.per)
+        self.updated = now
+        if self.tokens < 1:
+            wait = (1 - self.tokens) * self.per / self.rate
+            time.sleep(wait)
+            self.updated = time.monotonic()
+            self.tokens = 1.0
+        self.tokens -= 1
+
+
+# Telegram's published limits: ~30 messages/s across all chats, 1 message/s per chat
+GLOBAL_LIMITER = RateLimiter(30, 1.0)
+PER_CHAT_LIMITERS = defaultdict(lambda: RateLimiter(1, 1.0))
+
+
 def send_telegram_message(text: str, token: str, chat_id: str) -> bool:
     """
-    Send a Markdown message to Telegram. Retries once on failure.
+    Send a Markdown message to Telegram, paced by the global and per-chat limiters.
+    On 429, waits the retry_after Telegram asks for and tries again.
+    Other transient failures are retried by SESSION's adapter.
     Returns True on success, False otherwise. Never raises.
     """
     url = f"https://api.telegram.org/bot{token}/sendMessage"
@@ -164,50 +534,105 @@ def send_telegram_message(text: str, token: str, chat_id: str) -> bool:
         "parse_mode": "Markdown",
         "disable_web_page_preview": True,
     }
-    for attempt in range(2):
+    for attempt in range(1, TELEGRAM_MAX_ATTEMPTS + 1):
+        GLOBAL_LIMITER.acquire()
+        PER_CHAT_LIMITERS[chat_id].acquire()
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = SESSION.post(url, json=payload, timeout=10)
+            if response.status_code == 429 and attempt < TELEGRAM_MAX_ATTEMPTS:
+                # Sleeping exactly retry_after is what Telegram expects; guessing shorter gets another 429
+                try:
+                    retry_after = response.json().get("parameters", {}).get("retry_after", 1)
+                except ValueError:
+                    retry_after = 1
+                logging.warning(f"Telegram rate limit hit (attempt {attempt}). Retrying in {retry_after}s...")
+                time.sleep(retry_after)
+                continue
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
-            if attempt == 0:
-                logging.warning(f"Telegram send failed (attempt 1): {e}. Retrying in 5s...")
-                time.sleep(5)
-            else:
-                logging.error(f"Telegram send failed after retry: {e}. Message dropped.")
-                return False
+            logging.error(f"Telegram send failed after retries: {e}. Message dropped.")
+            return False
     return False
 
 
+# Telegram Markdown v1 special characters: * _ ` [
+_MD_RE = re.compile(r"([*_`\[])")
+
+
 def escape_markdown(text: str) -> str:
     """Escape Telegram Markdown v1 special characters in API-supplied strings."""
-    for char in ["*", "_", "`", "["]:
-        text = text.replace(char, f"\\{char}")
-    return text
+    # One regex pass instead of a str.replace() scan per character
+    return _MD_RE.sub(r"\\\1", text)
+
+
+# API-supplied fields that go into an alert, escaped together in format_new_job_message()
+ESCAPED_JOB_FIELDS = ("platform", "title", "department", "team", "location", "employment_type")
+
+NEW_JOB_TEMPLATE = (
+    "🆕 *New Job Alert* on {platform}\n\n"
+    "*{title}*\n"
+    "🏢 {dept_line}\n"
+    "📍 {location}{remote_tag}\n"
+    "💼 {employment_type}\n"
+    "📅 Published: {pub_date}\n\n"
+    "🔗 [View Job]({job_url})\n"
+    "✅ [Apply Now]({apply_url})"
+)
 
 
 def format_new_job_message(job: dict) -> str:
-    platform   = escape_markdown(job["platform"])
-    title      = escape_markdown(job["title"])
-    department = escape_markdown(job["department"])
-    team       = escape_markdown(job["team"])
-    location   = escape_markdown(job["location"])
-    emp_type   = escape_markdown(job["employment_type"])
-    remote_tag = " (Remote)" if job["is_remote"] else ""
-    pub_date   = job["published_at"][:10] if job["published_at"] else "Unknown"
-    dept_line  = f"{department} › {team}" if team else department
-
-    return (
-        f"🆕 *New Job Alert* on {platform}\n\n"
-        f"*{title}*\n"
-        f"🏢 {dept_line}\n"
-        f"📍 {location}{remote_tag}\n"
-        f"💼 {emp_type}\n"
-        f"📅 Published: {pub_date}\n\n"
-        f"🔗 [View Job]({job['job_url']})\n"
-        f"✅ [Apply Now]({job['apply_url']})"
-    )
-
+    # Escape every displayed API field up front, each in a single regex pass
+    fields = {key: escape_markdown(job[key]) for key in ESCAPED_JOB_FIELDS}
+    department = fields["department"]
+    team       = fields["team"]
+    fields["dept_line"]  = f"{department} › {team}" if team else department
+    fields["remote_tag"] = " (Remote)" if job["is_remote"] else ""
+    fields["pub_date"]   = job["published_at"][:10] if job["published_at"] else "Unknown"
+    fields["job_url"]    = job["job_url"]
+    fields["apply_url"]  = job["apply_url"]
+    return NEW_JOB_TEMPLATE.format_map(fields)
+
+
+def fit_job_block(job: dict) -> str:
+    """
+    Render a job's alert, shortening its longest text fields until it fits in one
+    message. Anything longer is rejected by Telegram, and since IDs are saved before
+    notifying, a rejected alert would never be retried.
+    """
+    block = format_new_job_message(job)
+    job = dict(job)
+    while len(block) > TELEGRAM_MESSAGE_LIMIT:
+        key = max(ESCAPED_JOB_FIELDS, key=lambda field: len(job[field]))
+        if len(job[key]) <= 1:
+            # Only the URLs are left to blame; a hard cut at least keeps the send from failing
+            return block[:TELEGRAM_MESSAGE_LIMIT]
+        # Cut the raw text, not the escaped block, so no escape or Markdown entity is split
+        overflow = len(block) - TELEGRAM_MESSAGE_LIMIT
+        job[key] = job[key][:max(0, len(job[key]) - overflow - 1)] + "…"
+        block = format_new_job_message(job)
+    return block
+
+
+def format_batch_message(jobs: list[dict]) -> list[str]:
+    """
+    Pack several job alerts into as few Telegram messages as possible.
+    Jobs are never split across messages; each message stays under
+    TELEGRAM_MESSAGE_LIMIT, leaving headroom below Telegram's 4096-char cap.
+    """
+    separator = "\n\n"
+    chunks = []
+    current = ""
+    for job in jobs:
+        block = fit_job_block(job)
+        if current and len(current) + len(separator) + len(block) > TELEGRAM_MESSAGE_LIMIT:
+            chunks.append(current)
+            current = block
+        else:
+            current = f"{current}{separator}{block}" if current else block
+    if current:
+        chunks.append(current)
+    return chunks
 
 
 # ---------------------------------------------------------------------------
@@ -223,26 +648,63 @@ def main() -> None:
 
     logging.info("Starting Multi-Board Job Alert Bot...")
 
+    # Keep the handle referenced until main() returns; the lock is released on exit
+    run_lock = acquire_run_lock(LOCK_FILE)
+    if run_lock is None:
+        logging.warning("Another run is already in progress. Exiting.")
+        return
+
     # 1. Load persisted state
-    seen_ids, is_first_run = load_seen_ids(JOBS_FILE)
+    seen_ids, is_first_run, needs_snapshot = load_seen_ids(JOBS_FILE)
+    board_cache = load_board_cache(BOARD_CACHE_FILE)
 
     # 2. Fetch current jobs from all Ashby boards
-    all_jobs = []
+    raw_jobs = []
     platforms_checked = []
     
-    for board in BOARDS:
-        logging.info(f"Fetching jobs for {board['name']}...")
-        board_jobs = fetch_jobs(board)
+    # Fetch boards concurrently: the time is spent waiting on the network, so the
+    # cycle takes as long as the slowest board rather than the sum of all of them.
+    # Each worker only touches its own board's cache entry.
+    board_caches = [board_cache.setdefault(board["name"], {}) for board in BOARDS]
+    # A 304 clears a board's failure backoff, which must then be written even on the
+    # early exit below; remember whether there was any to clear
+    had_failures = any("consecutive_failures" in cache for cache in board_caches)
+    logging.info(f"Fetching jobs for {len(BOARDS)} board(s)...")
+    # max(1, ...) because the pool rejects zero workers; an empty BOARDS list then
+    # falls through to the "No jobs returned" exit below
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(BOARDS)))) as executor:
+        results = list(executor.map(fetch_jobs, BOARDS, board_caches))
+
+    # Every board answered 304, so current IDs equal the saved ones: skip the diff
+    # and write nothing, leaving the workflow nothing to commit. The one exception is
+    # recovered boards whose failure backoff was just cleared. A first run still needs
+    # jobs.json created and a corrupt one needs rewriting, so neither takes this exit.
+    all_unchanged = bool(results) and all(result is NOT_MODIFIED for result in results)
+    if not is_first_run and not needs_snapshot and all_unchanged:
+        if had_failures:
+            save_board_cache(board_cache, BOARD_CACHE_FILE)
+        logging.info("All boards unchanged (304). Exiting.")
+        return
+
+    for board, cache, board_jobs in zip(BOARDS, board_caches, results):
+        if board_jobs is NOT_MODIFIED:
+            board_jobs = tag_jobs(cache["raw_jobs"], board["name"])
+        elif not board_jobs and cache.get("raw_jobs"):
+            # A failed board falls back to its last known jobs. Dropping them would
+            # mark them all removed, and they would be re-announced once it recovers.
+            logging.warning(f"Using last known jobs for {board['name']}.")
+            board_jobs = tag_jobs(cache["raw_jobs"], board["name"])
         if board_jobs:
-            all_jobs.extend(board_jobs)
+            raw_jobs.extend(board_jobs)
             platforms_checked.append(board["name"])
 
-    if not all_jobs:
+    save_board_cache(board_cache, BOARD_CACHE_FILE)
+
+    if not raw_jobs:
         logging.warning("No jobs returned from any board. Skipping this cycle.")
         return
 
-    current_ids = {job["id"] for job in all_jobs}
-    job_by_id   = {job["id"]: job for job in all_jobs}
+    current_ids = {internal_id for internal_id, _, _ in raw_jobs}
 
     # 3. First run: record all existing jobs silently, no Telegram alerts
     if is_first_run:
@@ -257,27 +719,46 @@ def main() -> None:
     new_ids     = current_ids - seen_ids
     removed_ids = seen_ids - current_ids
 
-    # 5. Update seen IDs: add new, remove stale (write-before-notify)
-    updated_ids = (seen_ids | new_ids) - removed_ids
-    save_seen_ids(updated_ids, JOBS_FILE)
+    # Only new jobs are ever displayed, so only they pay for normalisation
+    job_by_id = {
+        internal_id: normalise_job(raw, platform_name)
+        for internal_id, raw, platform_name in raw_jobs
+        if internal_id in new_ids
+    }
+
+    # 5. Update seen IDs: add new, remove stale (write-before-notify).
+    # Only the changes are journalled; a quiet board leaves the state files untouched.
+    # (seen | new) - removed is exactly current_ids: every new ID is current and every
+    # seen ID that is not current was removed. So current_ids is the updated set.
+    if needs_snapshot:
+        # jobs.json was unreadable: replace it with a full snapshot so the next run
+        # diffs against real state instead of re-announcing every job
+        save_seen_ids(current_ids, JOBS_FILE)
+    else:
+        append_seen_delta(current_ids, new_ids, removed_ids, JOBS_FILE)
 
     if removed_ids:
         logging.info(f"{len(removed_ids)} job(s) removed from the boards.")
 
     # 6. Send Telegram alerts for new jobs
-    from datetime import timedelta
-    tz = timezone(timedelta(hours=1))
-    timestamp = datetime.now(tz).strftime("%a %b %d, %Y at %I:%M %p")
-
     if new_ids:
+        record_new_postings(ACTIVITY_FILE)
         logging.info(f"{len(new_ids)} new job(s) found. Sending Telegram alerts...")
-        # Sort by ID or title for consistent ordering in notifications
-        for job_id in sorted(list(new_ids)):
-            job = job_by_id[job_id]
-            message = format_new_job_message(job)
+        # Group alerts by board, oldest posting first, so a batched message reads
+        # in order; the ID only breaks ties to keep the order deterministic
+        new_jobs = sorted(
+            (job_by_id[job_id] for job_id in new_ids),
+            key=lambda job: (job["platform"], job["published_at"] or "", job["id"]),
+        )
+        for job in new_jobs:
+            logging.info(f"New: [{job['platform']}] {job['title']} ({job['id']})")
+
+        # Coalesce alerts so N new jobs cost a handful of sends instead of N
+        messages = format_batch_message(new_jobs)
+        for index, message in enumerate(messages, start=1):
             success = send_telegram_message(message, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID)
             if success:
-                logging.info(f"Notified: [{job['platform']}] {job['title']} ({job_id})")
+                logging.info(f"Sent alert message {index} of {len(messages)}.")
     else:
         logging.info("No new jobs found during this cycle.")
 